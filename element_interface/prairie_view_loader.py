@@ -1,9 +1,19 @@
 import pathlib
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from typing import Optional, Union
 
 import numpy as np
 
+# ElementPath expressions, relative to a `PVStateValue` or to a `Frame`
+_X_AXIS_VALUE = "IndexedValue/[@index='XAxis']"
+_Y_AXIS_VALUE = "IndexedValue/[@index='YAxis']"
+_Z_AXIS_VALUE = "SubindexedValues/[@index='ZAxis']/SubindexedValue"
+_FRAME_Z_AXIS = (
+    "PVStateShard/PVStateValue/[@key='positionCurrent']"
+    "/SubindexedValues/[@index='ZAxis']"
+)
+
 
 def get_prairieview_metadata(ome_tif_filepath: str) -> dict:
     """Extract metadata for scans generated by Prairie View acquisition software.
@@ -32,124 +42,80 @@ def get_prairieview_metadata(ome_tif_filepath: str) -> dict:
     xml_files_list = pathlib.Path(ome_tif_filepath).parent.glob("*.xml")
 
     for file in xml_files_list:
-        xml_tree = ET.parse(file)
-        xml_file = xml_tree.getroot()
-        if xml_file.find(".//Sequence"):
+        # Screen out unrelated .xml files before paying for a full parse
+        if not _contains_sequence(file):
+            continue
+        xml_contents = _parse_prairieview_xml(file)
+        if xml_contents is not None:
             break
     else:
         raise FileNotFoundError(
             f"No PrarieView metadata .xml file found at {pathlib.Path(ome_tif_filepath).parent}"
         )
 
+    state_values = xml_contents["state_values"]
+
     bidirectional_scan = False  # Does not support bidirectional
     roi = 0
     n_fields = 1  # Always contains 1 field
-    recording_start_time = xml_file.find(".//Sequence/[@cycle='1']").attrib.get("time")
-
-    # Get all channels and find unique values
-    channel_list = [
-        int(channel.attrib.get("channel"))
-        for channel in xml_file.iterfind(".//Sequence/Frame/File/[@channel]")
-    ]
-    n_channels = len(set(channel_list))
-    n_frames = len(xml_file.findall(".//Sequence/Frame"))
+
+    recording_start_time = xml_contents["recording_time"]
+
+    n_channels = len(xml_contents["channels"])
+    n_frames = xml_contents["n_frames"]
     framerate = 1 / float(
-        xml_file.findall('.//PVStateValue/[@key="framePeriod"]')[0].attrib.get("value")
+        state_values["framePeriod"].attrib.get("value")
     )  # rate = 1/framePeriod
 
     usec_per_line = (
-        float(
-            xml_file.findall(".//PVStateValue/[@key='scanLinePeriod']")[0].attrib.get(
-                "value"
-            )
-        )
-        * 1e6
+        float(state_values["scanLinePeriod"].attrib.get("value")) * 1e6
     )  # Convert from seconds to microseconds
 
-    scan_datetime = datetime.strptime(
-        xml_file.attrib.get("date"), "%m/%d/%Y %I:%M:%S %p"
-    )
+    scan_datetime = datetime.strptime(xml_contents["date"], "%m/%d/%Y %I:%M:%S %p")
 
-    total_scan_duration = float(
-        xml_file.findall(".//Sequence/Frame")[-1].attrib.get("relativeTime")
-    )
+    total_scan_duration = float(xml_contents["last_frame_time"])
 
-    pixel_height = int(
-        xml_file.findall(".//PVStateValue/[@key='pixelsPerLine']")[0].attrib.get(
-            "value"
-        )
-    )
+    pixel_height = int(state_values["pixelsPerLine"].attrib.get("value"))
     # All PrairieView-acquired images have square dimensions (512 x 512; 1024 x 1024)
     pixel_width = pixel_height
 
     um_per_pixel = float(
-        xml_file.find(
-            ".//PVStateValue/[@key='micronsPerPixel']/IndexedValue/[@index='XAxis']"
-        ).attrib.get("value")
+        state_values["micronsPerPixel"].find(_X_AXIS_VALUE).attrib.get("value")
     )
 
     um_height = um_width = float(pixel_height) * um_per_pixel
 
     # x and y coordinate values for the center of the field
     x_field = float(
-        xml_file.find(
-            ".//PVStateValue/[@key='currentScanCenter']/IndexedValue/[@index='XAxis']"
-        ).attrib.get("value")
+        state_values["currentScanCenter"].find(_X_AXIS_VALUE).attrib.get("value")
     )
     y_field = float(
-        xml_file.find(
-            ".//PVStateValue/[@key='currentScanCenter']/IndexedValue/[@index='YAxis']"
-        ).attrib.get("value")
+        state_values["currentScanCenter"].find(_Y_AXIS_VALUE).attrib.get("value")
     )
-    if (
-        xml_file.find(
-            ".//Sequence/[@cycle='1']/Frame/PVStateShard/PVStateValue/[@key='positionCurrent']/SubindexedValues/[@index='ZAxis']"
-        )
-        is None
-    ):
+    if not xml_contents["z_axis_found"]:
         z_fields = np.float64(
-            xml_file.find(
-                ".//PVStateValue/[@key='positionCurrent']/SubindexedValues/[@index='ZAxis']/SubindexedValue"
-            ).attrib.get("value")
+            state_values["positionCurrent"].find(_Z_AXIS_VALUE).attrib.get("value")
         )
         n_depths = 1
         assert z_fields.size == n_depths
         bidirection_z = False
 
     else:
-        bidirection_z = (
-            xml_file.find(".//Sequence").attrib.get("bidirectionalZ") == "True"
-        )
+        bidirection_z = xml_contents["bidirectional_z"]
 
         # One "Frame" per depth in the .xml file. Gets number of frames in first sequence
-        planes = [
-            int(plane.attrib.get("index"))
-            for plane in xml_file.findall(".//Sequence/[@cycle='1']/Frame")
-        ]
-        n_depths = len(set(planes))
-
-        z_controllers = xml_file.findall(
-            ".//Sequence/[@cycle='1']/Frame/[@index='1']/PVStateShard/PVStateValue/[@key='positionCurrent']/SubindexedValues/[@index='ZAxis']/SubindexedValue"
-        )
+        n_depths = len(xml_contents["planes"])
 
-        # If more than one Z-axis controllers are found, 
+        z_controllers = xml_contents["z_controllers"]
+        z_values = xml_contents["z_values"]
+
+        # If more than one Z-axis controllers are found,
         # check which controller is changing z_field depth. Only 1 controller
         # must change depths.
         if len(z_controllers) > 1:
-            z_repeats = []
-            for controller in xml_file.findall(
-                ".//Sequence/[@cycle='1']/Frame/[@index='1']/PVStateShard/PVStateValue/[@key='positionCurrent']/SubindexedValues/[@index='ZAxis']/"
-            ):
-                z_repeats.append(
-                    [
-                        float(z.attrib.get("value"))
-                        for z in xml_file.findall(
-                            ".//Sequence/[@cycle='1']/Frame/PVStateShard/PVStateValue/[@key='positionCurrent']/SubindexedValues/[@index='ZAxis']/SubindexedValue/[@subindex='{0}']".format(
-                                controller.attrib.get("subindex")
-                            )
-                        )
-                    ]
-                )
+            z_repeats = [
+                [float(z) for z in z_values[controller]] for controller in z_controllers
+            ]
             controller_assert = [
                 not all(z == z_controller[0] for z in z_controller)
                 for z_controller in z_repeats
@@ -161,12 +127,7 @@ def get_prairieview_metadata(ome_tif_filepath: str) -> dict:
             z_fields = z_repeats[controller_assert.index(True)]
 
         else:
-            z_fields = [
-                z.attrib.get("value")
-                for z in xml_file.findall(
-                    ".//Sequence/[@cycle='1']/Frame/PVStateShard/PVStateValue/[@key='positionCurrent']/SubindexedValues/[@index='ZAxis']/SubindexedValue/[@subindex='0']"
-                )
-            ]
+            z_fields = [float(z) for z in z_values.get("0", [])]
 
         assert (
             len(z_fields) == n_depths
@@ -198,3 +159,132 @@ def get_prairieview_metadata(ome_tif_filepath: str) -> dict:
     )
 
     return metainfo
+
+
+def _contains_sequence(
+    xml_filepath: Union[pathlib.Path, str], chunk_size: int = 1 << 20
+) -> bool:
+    """Check whether the raw bytes of an .xml file contain a `Sequence` element.
+
+    Args:
+        xml_filepath: Path to a candidate Prairie View .xml file.
+        chunk_size: Number of bytes read at a time.
+
+    Returns:
+        True if the `<Sequence` tag occurs anywhere in the file.
+    """
+    tag = b"<Sequence"
+    tail = b""
+    with open(xml_filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            window = tail + chunk
+            if tag in window:
+                return True
+            # Keep the end of the window in case the tag straddles two reads
+            tail = window[1 - len(tag) :]
+    return False
+
+
+def _parse_prairieview_xml(xml_filepath: Union[pathlib.Path, str]) -> Optional[dict]:
+    """Parse a Prairie View .xml file in a single streaming pass.
+
+    Each `Frame` and `Sequence` is summarized as soon as it is parsed and then
+    cleared and detached from its parent, so memory use does not grow with the
+    length of the scan. The first `PVStateValue` found for each key holds the
+    scan-wide settings. Plane indices and z positions are only collected from the
+    frames of the first cycle.
+
+    Args:
+        xml_filepath: Path to a candidate Prairie View .xml file.
+
+    Returns:
+        xml_contents: A dict with the scan date, the first `PVStateValue` per key, the
+            set of channels, the number of frames, the `relativeTime` of the last
+            frame and, for the first cycle, its start time, bidirectional z flag, set
+            of plane indices, whether frames report a z position, the z controller
+            subindices of frame 1 and the z values per subindex. None if the file
+            contains no `Sequence`.
+    """
+    xml_contents = dict(
+        date=None,
+        state_values={},
+        channels=set(),
+        n_frames=0,
+        last_frame_time=None,
+        recording_time=None,
+        bidirectional_z=False,
+        planes=set(),
+        z_axis_found=False,
+        z_controllers=[],
+        z_values={},
+    )
+    open_elements = []  # Ancestors of the current element, root first
+    in_first_cycle = False
+
+    with open(xml_filepath, "rb") as f:
+        for event, element in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if not open_elements:
+                    xml_contents["date"] = element.attrib.get("date")
+                elif element.tag == "Sequence":
+                    in_first_cycle = (
+                        xml_contents["recording_time"] is None
+                        and element.attrib.get("cycle") == "1"
+                    )
+                    if in_first_cycle:
+                        xml_contents["recording_time"] = element.attrib.get("time")
+                        xml_contents["bidirectional_z"] = (
+                            element.attrib.get("bidirectionalZ") == "True"
+                        )
+                open_elements.append(element)
+                continue
+
+            open_elements.pop()
+            parent = open_elements[-1] if open_elements else None
+
+            if (
+                element.tag == "Frame"
+                and parent is not None
+                and parent.tag == "Sequence"
+            ):
+                xml_contents["n_frames"] += 1
+                xml_contents["last_frame_time"] = element.attrib.get("relativeTime")
+                for channel in element.iterfind("File/[@channel]"):
+                    xml_contents["channels"].add(int(channel.attrib.get("channel")))
+                if in_first_cycle:
+                    _collect_frame_depth(element, xml_contents)
+                element.clear()
+                parent.remove(element)
+            elif element.tag == "Sequence" and parent is not None:
+                in_first_cycle = False
+                element.clear()
+                parent.remove(element)
+            elif element.tag == "PVStateValue":
+                xml_contents["state_values"].setdefault(
+                    element.attrib.get("key"), element
+                )
+
+    if not xml_contents["n_frames"]:
+        return None
+
+    return xml_contents
+
+
+def _collect_frame_depth(frame, xml_contents: dict):
+    """Record the plane index and z positions of a first-cycle `Frame`.
+
+    Args:
+        frame: A fully parsed `Frame` element of the first cycle.
+        xml_contents: The dict being filled by `_parse_prairieview_xml`.
+    """
+    index = frame.attrib.get("index")
+    xml_contents["planes"].add(int(index))
+    for z_axis in frame.iterfind(_FRAME_Z_AXIS):
+        xml_contents["z_axis_found"] = True
+        for z in z_axis.iterfind("SubindexedValue"):
+            subindex = z.attrib.get("subindex")
+            xml_contents["z_values"].setdefault(subindex, []).append(
+                z.attrib.get("value")
+            )
+            if index == "1":
+                xml_contents["z_controllers"].append(subindex)